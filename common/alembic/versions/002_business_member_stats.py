@@ -0,0 +1,45 @@
+"""business member stats
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:12:04.518213
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from common.alembic.utils import read_sql_file
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    sql = read_sql_file("002_business_member_stats.sql")
+    op.execute(sql)
+
+def downgrade():
+    # Drop triggers first before dropping the functions they call
+    op.execute("DROP TRIGGER IF EXISTS update_users_member_stats_delete ON users")
+    op.execute("DROP TRIGGER IF EXISTS update_users_member_stats_update ON users")
+    op.execute("DROP TRIGGER IF EXISTS update_user_businesses_member_stats_update ON user_businesses")
+    op.execute("DROP TRIGGER IF EXISTS update_user_businesses_member_stats_delete ON user_businesses")
+    op.execute("DROP TRIGGER IF EXISTS update_user_businesses_member_stats_insert ON user_businesses")
+    op.execute("DROP TRIGGER IF EXISTS create_businesses_member_stats ON businesses")
+    op.execute("DROP TRIGGER IF EXISTS update_business_member_stats_updated_at ON business_member_stats")
+
+    # Drop the functions used by triggers and the rebuild command
+    op.execute("DROP FUNCTION IF EXISTS rebuild_business_member_stats(UUID)")
+    op.execute("DROP FUNCTION IF EXISTS create_business_member_stats()")
+    op.execute("DROP FUNCTION IF EXISTS update_business_member_stats_on_user_delete()")
+    op.execute("DROP FUNCTION IF EXISTS update_business_member_stats_on_user_update()")
+    op.execute("DROP FUNCTION IF EXISTS update_business_member_stats_on_membership()")
+    op.execute("DROP FUNCTION IF EXISTS apply_business_member_stats_delta(UUID, INTEGER, INTEGER, INTEGER)")
+
+    # Now drop the summary table
+    op.execute("DROP TABLE IF EXISTS business_member_stats")
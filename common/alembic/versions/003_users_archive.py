@@ -0,0 +1,104 @@
+"""users archive
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 11:40:52.207418
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from common.alembic.utils import read_sql_file
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    sql = read_sql_file("003_users_archive.sql")
+    op.execute(sql)
+
+    # Build the users indexes without blocking writes on the live table
+    with op.get_context().autocommit_block():
+        # Hot paths only read live rows, newest first
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_live_created_at "
+            "ON users(created_at DESC) WHERE deleted_at IS NULL"
+        )
+        # Lets the archival job find expired soft-deleted rows without a scan
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_deleted_at "
+            "ON users(deleted_at) WHERE deleted_at IS NOT NULL"
+        )
+
+def downgrade():
+    # Refuse to downgrade if any archived user can no longer be restored,
+    # e.g. because a new user has since registered with the same email
+    op.execute("""
+        DO $$
+        DECLARE
+            v_conflicts INTEGER;
+        BEGIN
+            SELECT COUNT(*)
+            INTO v_conflicts
+            FROM users_archive a
+            WHERE EXISTS (
+                SELECT 1 FROM users u
+                WHERE u.uuid = a.uuid OR u.email = a.email
+            )
+            OR EXISTS (
+                SELECT 1 FROM users_archive other
+                WHERE other.email = a.email AND other.uuid <> a.uuid
+            );
+
+            IF v_conflicts > 0 THEN
+                RAISE EXCEPTION
+                    'Cannot downgrade: % archived user(s) conflict on uuid or email with existing users; resolve them before dropping users_archive',
+                    v_conflicts;
+            END IF;
+        END;
+        $$
+    """)
+
+    # Restore archived rows before dropping the archive tables
+    op.execute("""
+        INSERT INTO users (
+            uuid, first_name, last_name, email, is_active,
+            is_pending, profile_picture_url, job_title,
+            created_at, updated_at, deleted_at
+        )
+        SELECT
+            uuid, first_name, last_name, email, is_active,
+            is_pending, profile_picture_url, job_title,
+            created_at, updated_at, deleted_at
+        FROM users_archive
+    """)
+    # Memberships of businesses deleted since archiving are not restored,
+    # the same as the ON DELETE CASCADE would have done for a live user
+    op.execute("""
+        INSERT INTO user_businesses (
+            uuid, user_uuid, business_uuid, role, is_primary,
+            created_at, updated_at
+        )
+        SELECT
+            uba.uuid, uba.user_uuid, uba.business_uuid, uba.role,
+            uba.is_primary, uba.created_at, uba.updated_at
+        FROM user_businesses_archive uba
+        JOIN businesses b ON b.uuid = uba.business_uuid
+    """)
+
+    op.execute("DROP FUNCTION IF EXISTS archive_deleted_users(TIMESTAMP WITH TIME ZONE, INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS ensure_users_archive_partition(TIMESTAMP WITH TIME ZONE)")
+
+    # Dropping the partitioned parent drops its monthly partitions too
+    op.execute("DROP TABLE IF EXISTS user_businesses_archive")
+    op.execute("DROP TABLE IF EXISTS users_archive")
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_users_deleted_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_users_live_created_at")
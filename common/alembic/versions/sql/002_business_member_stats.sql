@@ -0,0 +1,268 @@
+-- Block writes to the source tables until the migration commits, so nothing
+-- changes between the backfill below and the creation of the triggers
+LOCK TABLE businesses, users, user_businesses IN SHARE ROW EXCLUSIVE MODE;
+
+-- Summary table holding per-business membership aggregates.
+-- A member is a user linked through user_businesses whose row is not
+-- soft-deleted; active/pending are the subsets with is_active/is_pending set.
+CREATE TABLE IF NOT EXISTS business_member_stats (
+    business_uuid UUID PRIMARY KEY REFERENCES businesses(uuid) ON DELETE CASCADE,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    active_count INTEGER NOT NULL DEFAULT 0,
+    pending_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Apply a signed delta to one business's aggregates.
+-- The row is created on first use; deltas for businesses that no longer
+-- exist (e.g. while a business delete cascades) are ignored.
+CREATE OR REPLACE FUNCTION apply_business_member_stats_delta(
+    p_business_uuid UUID,
+    p_member_delta INTEGER,
+    p_active_delta INTEGER,
+    p_pending_delta INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+    IF p_member_delta = 0 AND p_active_delta = 0 AND p_pending_delta = 0 THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO business_member_stats (
+        business_uuid, member_count, active_count, pending_count
+    )
+    SELECT b.uuid, p_member_delta, p_active_delta, p_pending_delta
+    FROM businesses b
+    WHERE b.uuid = p_business_uuid
+    ON CONFLICT (business_uuid) DO UPDATE SET
+        member_count = business_member_stats.member_count + EXCLUDED.member_count,
+        active_count = business_member_stats.active_count + EXCLUDED.active_count,
+        pending_count = business_member_stats.pending_count + EXCLUDED.pending_count;
+END;
+$$ language 'plpgsql';
+
+-- Keep aggregates in step with rows added to / removed from user_businesses.
+-- The user row is read FOR SHARE so a concurrent change to is_active,
+-- is_pending or deleted_at waits for this membership change (and vice versa)
+-- instead of both transactions applying deltas computed from stale state.
+CREATE OR REPLACE FUNCTION update_business_member_stats_on_membership()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_deleted_at TIMESTAMP WITH TIME ZONE;
+    v_is_active BOOLEAN;
+    v_is_pending BOOLEAN;
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        -- When a user delete cascades here the user row is already gone and
+        -- its contribution was removed by update_business_member_stats_on_user_delete
+        SELECT deleted_at, is_active, is_pending
+        INTO v_deleted_at, v_is_active, v_is_pending
+        FROM users
+        WHERE uuid = OLD.user_uuid
+        FOR SHARE;
+
+        IF FOUND AND v_deleted_at IS NULL THEN
+            PERFORM apply_business_member_stats_delta(
+                OLD.business_uuid,
+                -1,
+                CASE WHEN v_is_active THEN -1 ELSE 0 END,
+                CASE WHEN v_is_pending THEN -1 ELSE 0 END
+            );
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT deleted_at, is_active, is_pending
+        INTO v_deleted_at, v_is_active, v_is_pending
+        FROM users
+        WHERE uuid = NEW.user_uuid
+        FOR SHARE;
+
+        IF FOUND AND v_deleted_at IS NULL THEN
+            PERFORM apply_business_member_stats_delta(
+                NEW.business_uuid,
+                1,
+                CASE WHEN v_is_active THEN 1 ELSE 0 END,
+                CASE WHEN v_is_pending THEN 1 ELSE 0 END
+            );
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Move a user's contribution when is_active, is_pending or deleted_at change
+CREATE OR REPLACE FUNCTION update_business_member_stats_on_user_update()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_member_delta INTEGER;
+    v_active_delta INTEGER;
+    v_pending_delta INTEGER;
+    v_business_uuid UUID;
+BEGIN
+    v_member_delta :=
+        (CASE WHEN NEW.deleted_at IS NULL THEN 1 ELSE 0 END)
+        - (CASE WHEN OLD.deleted_at IS NULL THEN 1 ELSE 0 END);
+    v_active_delta :=
+        (CASE WHEN NEW.deleted_at IS NULL AND NEW.is_active THEN 1 ELSE 0 END)
+        - (CASE WHEN OLD.deleted_at IS NULL AND OLD.is_active THEN 1 ELSE 0 END);
+    v_pending_delta :=
+        (CASE WHEN NEW.deleted_at IS NULL AND NEW.is_pending THEN 1 ELSE 0 END)
+        - (CASE WHEN OLD.deleted_at IS NULL AND OLD.is_pending THEN 1 ELSE 0 END);
+
+    IF v_member_delta = 0 AND v_active_delta = 0 AND v_pending_delta = 0 THEN
+        RETURN NULL;
+    END IF;
+
+    -- Lock stats rows in a stable order so concurrent updates cannot deadlock
+    FOR v_business_uuid IN
+        SELECT business_uuid
+        FROM user_businesses
+        WHERE user_uuid = NEW.uuid
+        ORDER BY business_uuid
+    LOOP
+        PERFORM apply_business_member_stats_delta(
+            v_business_uuid, v_member_delta, v_active_delta, v_pending_delta
+        );
+    END LOOP;
+
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Remove a user's contribution before the delete cascades to user_businesses
+CREATE OR REPLACE FUNCTION update_business_member_stats_on_user_delete()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_business_uuid UUID;
+BEGIN
+    IF OLD.deleted_at IS NOT NULL THEN
+        RETURN OLD;
+    END IF;
+
+    FOR v_business_uuid IN
+        SELECT business_uuid
+        FROM user_businesses
+        WHERE user_uuid = OLD.uuid
+        ORDER BY business_uuid
+    LOOP
+        PERFORM apply_business_member_stats_delta(
+            v_business_uuid,
+            -1,
+            CASE WHEN OLD.is_active THEN -1 ELSE 0 END,
+            CASE WHEN OLD.is_pending THEN -1 ELSE 0 END
+        );
+    END LOOP;
+
+    RETURN OLD;
+END;
+$$ language 'plpgsql';
+
+-- Every business starts with an empty aggregate row
+CREATE OR REPLACE FUNCTION create_business_member_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO business_member_stats (business_uuid)
+    VALUES (NEW.uuid)
+    ON CONFLICT (business_uuid) DO NOTHING;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Recompute one business's aggregates from user_businesses/users.
+-- The stats row is locked first so membership changes for the business
+-- wait for the rebuild and then apply their deltas on top of it.
+CREATE OR REPLACE FUNCTION rebuild_business_member_stats(p_business_uuid UUID)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO business_member_stats (business_uuid)
+    SELECT b.uuid FROM businesses b WHERE b.uuid = p_business_uuid
+    ON CONFLICT (business_uuid) DO NOTHING;
+
+    PERFORM 1
+    FROM business_member_stats
+    WHERE business_uuid = p_business_uuid
+    FOR UPDATE;
+
+    UPDATE business_member_stats s
+    SET
+        member_count = c.member_count,
+        active_count = c.active_count,
+        pending_count = c.pending_count
+    FROM (
+        SELECT
+            COUNT(*) AS member_count,
+            COUNT(*) FILTER (WHERE u.is_active) AS active_count,
+            COUNT(*) FILTER (WHERE u.is_pending) AS pending_count
+        FROM user_businesses ub
+        JOIN users u ON u.uuid = ub.user_uuid
+        WHERE ub.business_uuid = p_business_uuid
+            AND u.deleted_at IS NULL
+    ) c
+    WHERE s.business_uuid = p_business_uuid;
+END;
+$$ language 'plpgsql';
+
+-- Backfill aggregates for existing businesses
+INSERT INTO business_member_stats (
+    business_uuid, member_count, active_count, pending_count
+)
+SELECT
+    b.uuid,
+    COUNT(u.uuid),
+    COUNT(u.uuid) FILTER (WHERE u.is_active),
+    COUNT(u.uuid) FILTER (WHERE u.is_pending)
+FROM businesses b
+LEFT JOIN user_businesses ub ON ub.business_uuid = b.uuid
+LEFT JOIN users u ON u.uuid = ub.user_uuid AND u.deleted_at IS NULL
+GROUP BY b.uuid
+ON CONFLICT (business_uuid) DO UPDATE SET
+    member_count = EXCLUDED.member_count,
+    active_count = EXCLUDED.active_count,
+    pending_count = EXCLUDED.pending_count;
+
+CREATE TRIGGER update_business_member_stats_updated_at
+    BEFORE UPDATE ON business_member_stats
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TRIGGER create_businesses_member_stats
+    AFTER INSERT ON businesses
+    FOR EACH ROW
+    EXECUTE FUNCTION create_business_member_stats();
+
+CREATE TRIGGER update_user_businesses_member_stats_insert
+    AFTER INSERT ON user_businesses
+    FOR EACH ROW
+    EXECUTE FUNCTION update_business_member_stats_on_membership();
+
+CREATE TRIGGER update_user_businesses_member_stats_delete
+    AFTER DELETE ON user_businesses
+    FOR EACH ROW
+    EXECUTE FUNCTION update_business_member_stats_on_membership();
+
+CREATE TRIGGER update_user_businesses_member_stats_update
+    AFTER UPDATE OF user_uuid, business_uuid ON user_businesses
+    FOR EACH ROW
+    WHEN (
+        OLD.user_uuid IS DISTINCT FROM NEW.user_uuid
+        OR OLD.business_uuid IS DISTINCT FROM NEW.business_uuid
+    )
+    EXECUTE FUNCTION update_business_member_stats_on_membership();
+
+CREATE TRIGGER update_users_member_stats_update
+    AFTER UPDATE OF is_active, is_pending, deleted_at ON users
+    FOR EACH ROW
+    WHEN (
+        OLD.is_active IS DISTINCT FROM NEW.is_active
+        OR OLD.is_pending IS DISTINCT FROM NEW.is_pending
+        OR OLD.deleted_at IS DISTINCT FROM NEW.deleted_at
+    )
+    EXECUTE FUNCTION update_business_member_stats_on_user_update();
+
+CREATE TRIGGER update_users_member_stats_delete
+    BEFORE DELETE ON users
+    FOR EACH ROW
+    EXECUTE FUNCTION update_business_member_stats_on_user_delete();
@@ -0,0 +1,154 @@
+-- Archive for soft-deleted users, partitioned by month of deleted_at.
+-- The live users table keeps its uuid primary key, unique email and the
+-- user_businesses foreign key; expired soft-deleted rows are moved here
+-- by archive_deleted_users() so the table hot paths scan stays small.
+CREATE TABLE IF NOT EXISTS users_archive (
+    uuid UUID NOT NULL,
+    first_name VARCHAR(100),
+    last_name VARCHAR(100),
+    email VARCHAR(255),
+    is_active BOOLEAN,
+    is_pending BOOLEAN,
+    profile_picture_url TEXT,
+    job_title VARCHAR(100),
+    created_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    deleted_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    archived_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (uuid, deleted_at)
+) PARTITION BY RANGE (deleted_at);
+
+CREATE INDEX IF NOT EXISTS idx_users_archive_email ON users_archive(email);
+
+-- Memberships of archived users, kept so an archived user can be restored
+CREATE TABLE IF NOT EXISTS user_businesses_archive (
+    uuid UUID PRIMARY KEY,
+    user_uuid UUID NOT NULL,
+    business_uuid UUID NOT NULL,
+    role VARCHAR(100),
+    is_primary BOOLEAN,
+    created_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    archived_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_user_businesses_archive_user_uuid ON user_businesses_archive(user_uuid);
+
+-- Create the monthly users_archive partition holding p_deleted_at (UTC months)
+CREATE OR REPLACE FUNCTION ensure_users_archive_partition(p_deleted_at TIMESTAMP WITH TIME ZONE)
+RETURNS VOID AS $$
+DECLARE
+    v_month_start TIMESTAMP;
+BEGIN
+    v_month_start := date_trunc('month', p_deleted_at AT TIME ZONE 'UTC');
+
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF users_archive FOR VALUES FROM (%L) TO (%L)',
+        'users_archive_' || to_char(v_month_start, 'YYYY_MM'),
+        v_month_start AT TIME ZONE 'UTC',
+        (v_month_start + INTERVAL '1 month') AT TIME ZONE 'UTC'
+    );
+END;
+$$ language 'plpgsql';
+
+-- Move one batch of users soft-deleted before p_cutoff into users_archive.
+-- Only the selected users and their memberships are locked (SKIP LOCKED leaves
+-- rows busy in other transactions for a later batch). Returns the number of
+-- users archived.
+CREATE OR REPLACE FUNCTION archive_deleted_users(
+    p_cutoff TIMESTAMP WITH TIME ZONE,
+    p_batch_size INTEGER
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_uuids UUID[];
+    v_busy_uuids UUID[];
+    v_deleted_at TIMESTAMP WITH TIME ZONE;
+    v_count INTEGER;
+BEGIN
+    -- Serialize archival runs so partitions are never created concurrently
+    PERFORM pg_advisory_xact_lock(hashtext('archive_deleted_users'));
+
+    SELECT array_agg(t.uuid)
+    INTO v_uuids
+    FROM (
+        SELECT uuid
+        FROM users
+        WHERE deleted_at IS NOT NULL
+            AND deleted_at < p_cutoff
+        ORDER BY deleted_at
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    ) t;
+
+    IF v_uuids IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    -- The delete below cascades to user_businesses, so lock the candidates'
+    -- memberships up front and leave users with a busy membership row for a
+    -- later batch instead of waiting on it
+    WITH locked AS MATERIALIZED (
+        SELECT uuid
+        FROM user_businesses
+        WHERE user_uuid = ANY(v_uuids)
+        FOR UPDATE SKIP LOCKED
+    )
+    SELECT array_agg(DISTINCT ub.user_uuid)
+    INTO v_busy_uuids
+    FROM user_businesses ub
+    WHERE ub.user_uuid = ANY(v_uuids)
+        AND ub.uuid NOT IN (SELECT uuid FROM locked);
+
+    IF v_busy_uuids IS NOT NULL THEN
+        SELECT array_agg(candidate)
+        INTO v_uuids
+        FROM unnest(v_uuids) AS candidate
+        WHERE candidate <> ALL(v_busy_uuids);
+
+        IF v_uuids IS NULL THEN
+            RETURN 0;
+        END IF;
+    END IF;
+
+    FOR v_deleted_at IN
+        SELECT DISTINCT date_trunc('month', deleted_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+        FROM users
+        WHERE uuid = ANY(v_uuids)
+    LOOP
+        PERFORM ensure_users_archive_partition(v_deleted_at);
+    END LOOP;
+
+    INSERT INTO user_businesses_archive (
+        uuid, user_uuid, business_uuid, role, is_primary, created_at, updated_at
+    )
+    SELECT uuid, user_uuid, business_uuid, role, is_primary, created_at, updated_at
+    FROM user_businesses
+    WHERE user_uuid = ANY(v_uuids)
+    ON CONFLICT (uuid) DO NOTHING;
+
+    -- Deleting from users cascades to user_businesses; soft-deleted users
+    -- no longer count towards business_member_stats so no delta is applied
+    WITH moved AS (
+        DELETE FROM users
+        WHERE uuid = ANY(v_uuids)
+        RETURNING
+            uuid, first_name, last_name, email, is_active,
+            is_pending, profile_picture_url, job_title,
+            created_at, updated_at, deleted_at
+    )
+    INSERT INTO users_archive (
+        uuid, first_name, last_name, email, is_active,
+        is_pending, profile_picture_url, job_title,
+        created_at, updated_at, deleted_at
+    )
+    SELECT
+        uuid, first_name, last_name, email, is_active,
+        is_pending, profile_picture_url, job_title,
+        created_at, updated_at, deleted_at
+    FROM moved;
+
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+    RETURN v_count;
+END;
+$$ language 'plpgsql';
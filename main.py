@@ -1,5 +1,9 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from src.user.handler import router as user_router
+from src.business.handler import router as business_router
+from src.business.repository import business_db
 
 import logging
 import sys
@@ -11,6 +15,15 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared business pool once instead of per request
+    await business_db.initialize()
+    yield
+    await business_db.close_pool()
+
+
 # Initialize the FastAPI application
 app = FastAPI(
     title="MARCO PLATFORM API",
@@ -18,10 +31,12 @@ app = FastAPI(
     version="1.0.0",
     redirect_slashes=True,
     swagger_ui_parameters={"displayRequestDuration": True},
+    lifespan=lifespan,
 )
 
 # Include routers
 app.include_router(user_router, prefix="/api/users", tags=["Users"])
+app.include_router(business_router, prefix="/api/businesses", tags=["Businesses"])
 
 # Run database migrations and checks before starting the server
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends
+from .service import BusinessService
+from .schema import BusinessStatsResponse
+
+
+router = APIRouter()
+
+business_service = BusinessService()
+
+
+def get_business_service() -> BusinessService:
+    return business_service
+
+@router.get("/{uuid}/stats", response_model=BusinessStatsResponse)
+async def get_business_stats_async(
+    uuid: UUID, service: BusinessService = Depends(get_business_service)
+):
+    stats = await service.get_business_stats(uuid)
+    return BusinessStatsResponse(
+        data=stats, status_code=200, message="Business stats retrieved successfully"
+    )
@@ -0,0 +1,152 @@
+from common.db.marco_async_postgresql import MarcoAsyncPostgreSQL
+from fastapi import HTTPException
+from uuid import UUID
+from typing import Optional
+from .schema import BusinessStatsData, BusinessStatsDrift
+
+
+# One pool shared by every BusinessRepository; opened and closed by the app lifespan
+business_db = MarcoAsyncPostgreSQL()
+
+
+class BusinessRepository:
+
+    def __init__(self, connection: MarcoAsyncPostgreSQL = business_db):
+        self.connection = connection
+
+    def _tuple_to_dict(self, row, columns):
+        """Convert a database row tuple to a dictionary using column names"""
+        if not row:
+            return None
+        return dict(zip(columns, row))
+
+    async def get_business_stats(self, business_uuid: UUID) -> BusinessStatsData:
+        """Read the trigger-maintained aggregates for a business"""
+        async with self.connection.get_cursor() as cursor:
+            query = """
+                SELECT
+                    business_uuid, member_count, active_count,
+                    pending_count, updated_at
+                FROM business_member_stats
+                WHERE business_uuid = %s
+            """
+
+            await cursor.execute(query, (business_uuid,))
+            result = await cursor.fetchone()
+
+            if not result:
+                raise HTTPException(
+                    status_code=404,
+                    detail={
+                        "message": "Business not found",
+                        "error": "BUSINESS_NOT_FOUND"
+                    },
+                )
+
+            columns = [desc[0] for desc in cursor.description]
+            stats_dict = self._tuple_to_dict(result, columns)
+            return BusinessStatsData(**stats_dict)
+
+    async def get_business_uuids(self) -> list[UUID]:
+        async with self.connection.get_cursor() as cursor:
+            query = """
+                SELECT uuid
+                FROM businesses
+                ORDER BY uuid
+            """
+            await cursor.execute(query)
+            results = await cursor.fetchall()
+            return [row[0] for row in results]
+
+    async def find_business_stats_drift(
+            self, business_uuid: Optional[UUID] = None
+    ) -> list[BusinessStatsDrift]:
+        """Compare stored aggregates against a full recount.
+
+        Scans user_businesses joined to users, so this is meant for the
+        maintenance command rather than request paths.
+        """
+        async with self.connection.get_cursor() as cursor:
+            query = """
+                SELECT
+                    b.uuid AS business_uuid,
+                    s.business_uuid AS stored_business_uuid,
+                    s.member_count AS stored_member_count,
+                    s.active_count AS stored_active_count,
+                    s.pending_count AS stored_pending_count,
+                    s.updated_at AS stored_updated_at,
+                    COALESCE(c.member_count, 0) AS member_count,
+                    COALESCE(c.active_count, 0) AS active_count,
+                    COALESCE(c.pending_count, 0) AS pending_count
+                FROM businesses b
+                LEFT JOIN business_member_stats s
+                    ON s.business_uuid = b.uuid
+                LEFT JOIN (
+                    SELECT
+                        ub.business_uuid,
+                        COUNT(*) AS member_count,
+                        COUNT(*) FILTER (WHERE u.is_active) AS active_count,
+                        COUNT(*) FILTER (WHERE u.is_pending) AS pending_count
+                    FROM user_businesses ub
+                    JOIN users u ON u.uuid = ub.user_uuid
+                    WHERE u.deleted_at IS NULL
+                        AND (%(business_uuid)s::uuid IS NULL
+                             OR ub.business_uuid = %(business_uuid)s::uuid)
+                    GROUP BY ub.business_uuid
+                ) c ON c.business_uuid = b.uuid
+                WHERE (%(business_uuid)s::uuid IS NULL
+                       OR b.uuid = %(business_uuid)s::uuid)
+                    AND (
+                        s.business_uuid IS NULL
+                        OR s.member_count <> COALESCE(c.member_count, 0)
+                        OR s.active_count <> COALESCE(c.active_count, 0)
+                        OR s.pending_count <> COALESCE(c.pending_count, 0)
+                    )
+                ORDER BY b.uuid
+            """
+
+            await cursor.execute(query, {"business_uuid": business_uuid})
+            results = await cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+
+            drift = []
+            for row in results:
+                row_dict = self._tuple_to_dict(row, columns)
+                stored = None
+                if row_dict["stored_business_uuid"] is not None:
+                    stored = BusinessStatsData(
+                        business_uuid=row_dict["stored_business_uuid"],
+                        member_count=row_dict["stored_member_count"],
+                        active_count=row_dict["stored_active_count"],
+                        pending_count=row_dict["stored_pending_count"],
+                        updated_at=row_dict["stored_updated_at"],
+                    )
+                actual = BusinessStatsData(
+                    business_uuid=row_dict["business_uuid"],
+                    member_count=row_dict["member_count"],
+                    active_count=row_dict["active_count"],
+                    pending_count=row_dict["pending_count"],
+                )
+                drift.append(BusinessStatsDrift(
+                    business_uuid=row_dict["business_uuid"],
+                    stored=stored,
+                    actual=actual,
+                ))
+            return drift
+
+    async def rebuild_business_stats(self, business_uuid: UUID) -> None:
+        """Recount one business in its own transaction.
+
+        The stats row lock is only held for a single business, so writers
+        to other businesses are never blocked by a rebuild.
+        """
+        async with self.connection.get_cursor() as cursor:
+            try:
+                await cursor.execute(
+                    "SELECT rebuild_business_member_stats(%s)", (business_uuid,)
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to rebuild business stats: {str(e)}",
+                ) from e
@@ -0,0 +1,32 @@
+import datetime
+from typing import Optional, Any
+from uuid import UUID
+from pydantic import BaseModel
+
+class BusinessStatsData(BaseModel):
+    business_uuid: UUID
+    member_count: int = 0
+    active_count: int = 0
+    pending_count: int = 0
+    updated_at: Optional[datetime.datetime] = None
+
+    class Config:
+        use_enum_values = True
+
+
+class BusinessStatsDrift(BaseModel):
+    business_uuid: UUID
+    stored: Optional[BusinessStatsData] = None
+    actual: BusinessStatsData
+
+    class Config:
+        use_enum_values = True
+
+
+class BusinessStatsResponse(BaseModel):
+    data: Any
+    status_code: int
+    message: str
+
+    class Config:
+        use_enum_values = True
@@ -0,0 +1,29 @@
+from uuid import UUID
+
+from typing import List, Optional
+from .repository import BusinessRepository
+from .schema import BusinessStatsData, BusinessStatsDrift
+
+class BusinessService:
+
+    def __init__(self):
+        self.business_repository: BusinessRepository = BusinessRepository()
+
+    async def get_business_stats(self, uuid: UUID) -> BusinessStatsData:
+        stats = await self.business_repository.get_business_stats(uuid)
+        return stats
+
+    async def verify_business_stats(self, uuid: Optional[UUID] = None) -> List[BusinessStatsDrift]:
+        drift = await self.business_repository.find_business_stats_drift(uuid)
+        return drift
+
+    async def rebuild_business_stats(self, uuid: Optional[UUID] = None) -> List[UUID]:
+        # Rebuild one business per transaction so locks stay short
+        if uuid is not None:
+            business_uuids = [uuid]
+        else:
+            business_uuids = await self.business_repository.get_business_uuids()
+
+        for business_uuid in business_uuids:
+            await self.business_repository.rebuild_business_stats(business_uuid)
+        return business_uuids
@@ -0,0 +1,71 @@
+"""Verify or rebuild the trigger-maintained business member stats.
+
+Usage:
+    python -m src.business.stats_command verify [--business UUID]
+    python -m src.business.stats_command rebuild [--business UUID] [--all]
+
+``verify`` exits with status 1 when stored aggregates drift from a full
+recount. ``rebuild`` repairs the drifted businesses, or every business when
+``--all`` is given.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+from .service import BusinessService
+
+
+async def verify(service: BusinessService, business_uuid: UUID = None) -> int:
+    drift = await service.verify_business_stats(business_uuid)
+    for entry in drift:
+        stored = entry.stored
+        logging.warning(
+            f"Drift for business {entry.business_uuid}: "
+            f"stored={stored.model_dump(exclude={'business_uuid', 'updated_at'}) if stored else None} "
+            f"actual={entry.actual.model_dump(exclude={'business_uuid', 'updated_at'})}"
+        )
+    logging.info(f"{len(drift)} business(es) with drifted stats")
+    return 1 if drift else 0
+
+
+async def rebuild(service: BusinessService, business_uuid: UUID = None,
+                  rebuild_all: bool = False) -> int:
+    if business_uuid is not None or rebuild_all:
+        rebuilt = await service.rebuild_business_stats(business_uuid)
+    else:
+        drift = await service.verify_business_stats()
+        rebuilt = []
+        for entry in drift:
+            await service.rebuild_business_stats(entry.business_uuid)
+            rebuilt.append(entry.business_uuid)
+    logging.info(f"Rebuilt stats for {len(rebuilt)} business(es)")
+    return 0
+
+
+async def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("action", choices=["verify", "rebuild"])
+    parser.add_argument("--business", type=UUID, default=None,
+                        help="Only check or rebuild this business")
+    parser.add_argument("--all", action="store_true", dest="rebuild_all",
+                        help="Rebuild every business, not only drifted ones")
+    args = parser.parse_args(argv)
+
+    service = BusinessService()
+    try:
+        if args.action == "verify":
+            return await verify(service, args.business)
+        return await rebuild(service, args.business, args.rebuild_all)
+    finally:
+        await service.business_repository.connection.close_pool()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
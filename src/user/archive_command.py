@@ -0,0 +1,50 @@
+"""Archive users soft-deleted longer ago than the retention window.
+
+Usage:
+    python -m src.user.archive_command [--retention-days N] [--batch-size N]
+
+Rows are moved from ``users`` into the monthly ``users_archive`` partitions
+in batches, one short transaction per batch, so the live table stays small.
+"""
+
+import argparse
+import asyncio
+import datetime
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+from .service import UserService
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+async def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--retention-days", type=int, default=90,
+                        help="Keep soft-deleted users this many days before archiving")
+    parser.add_argument("--batch-size", type=positive_int, default=1000,
+                        help="Users moved per transaction")
+    args = parser.parse_args(argv)
+
+    service = UserService()
+    try:
+        archived = await service.archive_deleted_users(
+            datetime.timedelta(days=args.retention_days), args.batch_size
+        )
+        logging.info(f"Archived {archived} soft-deleted user(s)")
+        return 0
+    finally:
+        await service.user_repository.connection.close_pool()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
@@ -1,5 +1,6 @@
-from common.db. import MarcoAsyncPostgreSQL
+from common.db.marco_async_postgresql import MarcoAsyncPostgreSQL
 from fastapi import HTTPException
+import datetime
 from uuid import UUID
 from typing import Optional
 from .schema import UserData
@@ -168,4 +169,22 @@ class UserRepository:
             """
             await cursor.execute(query, (business_uuid,))
             results = await cursor.fetchall()
-            return [row[0] for row in results]
\ No newline at end of file
+            return [row[0] for row in results]
+
+    async def archive_deleted_users(self, cutoff: datetime.datetime,
+                                    batch_size: int,
+                                    lock_timeout: str = "5s") -> int:
+        """Move one batch of users soft-deleted before cutoff to users_archive.
+
+        Each batch is its own short transaction; lock_timeout makes a batch
+        fail fast instead of queueing behind long-running writers.
+        """
+        async with self.connection.get_cursor() as cursor:
+            await cursor.execute(
+                "SELECT set_config('lock_timeout', %s, true)", (lock_timeout,)
+            )
+            await cursor.execute(
+                "SELECT archive_deleted_users(%s, %s)", (cutoff, batch_size)
+            )
+            result = await cursor.fetchone()
+            return result[0]
@@ -1,6 +1,10 @@
 from uuid import UUID
 import uuid
+import asyncio
 import datetime
+import logging
+
+from psycopg.errors import LockNotAvailable
 
 from typing import List
 from .repository import UserRepository
@@ -37,6 +41,34 @@ class UserService:
     async def add_user_to_business(self, user_uuid: UUID, business_uuid: UUID) -> None:
         await self.user_repository.add_user_to_business(user_uuid, business_uuid)
 
+    async def archive_deleted_users(self, retention: datetime.timedelta, batch_size: int,
+                                    max_lock_timeouts: int = 3) -> int:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        # Archive one batch per transaction until nothing older than the retention window is left
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - retention
+        total_archived = 0
+        lock_timeouts = 0
+        while True:
+            try:
+                archived = await self.user_repository.archive_deleted_users(cutoff, batch_size)
+            except LockNotAvailable as e:
+                # The batch was rolled back; back off and retry, and after max_lock_timeouts leave the rest for a later run
+                lock_timeouts += 1
+                if lock_timeouts > max_lock_timeouts:
+                    logging.warning(
+                        f"Stopping archival after {lock_timeouts} lock timeouts: {e}"
+                    )
+                    return total_archived
+                logging.warning(f"Archival batch hit a lock timeout, retrying: {e}")
+                await asyncio.sleep(lock_timeouts)
+                continue
+            total_archived += archived
+            # Batches can come back short when busy users are skipped, so only stop once nothing moved
+            if archived == 0:
+                return total_archived
+
     async def create_user_async(self, user_request: UserCreateRequest) -> UserData:
         # Generate UUID and timestamps
         user_uuid = uuid.uuid4()